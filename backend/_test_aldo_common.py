@@ -0,0 +1,17 @@
+from app.api import engine
+from app.models import SimulationRequest, Perturbation, SimulationOptions
+
+
+def run_svr_increase():
+    """Simulate an SVR increase against the current packs and engine code.
+
+    Returns (response, node_states) so callers do not depend on engine state.
+    """
+    req = SimulationRequest(
+        perturbations=[Perturbation(node_id='cardio.hemodynamics.svr', op='increase')],
+        context={},
+        options=SimulationOptions(max_hops=15, min_confidence=0.0, time_window='days', dim_unaffected=False),
+        expanded_nodes=[], resolution='micro', show_readouts=False
+    )
+    res = engine.simulate(req)
+    return res, res.node_states
@@ -7,6 +7,7 @@ from .models import (
     CompareSimulationResponse,
     ComparedNode,
     AffectedNode,
+    GraphResponse,
     Node,
     Edge,
 )
@@ -24,8 +25,11 @@ nodes, edges, rules = loader.load_all()
 engine = ReasoningEngine(nodes, edges, loader.syndromes)
 
 
-def _reload_engine_state():
+def _reload_engine_state(force: bool = False):
     global nodes, edges, rules, engine
+    # Rebuilding is only needed when a pack file changed since the last load.
+    if not force and loader.pack_signature() == loader.signature:
+        return
     nodes, edges, rules = loader.load_all()
     engine = ReasoningEngine(nodes, edges, loader.syndromes)
 
@@ -77,14 +81,17 @@ def _classify_change(
         change_type=change_type,
     )
 
-@router.get("/graph")
+@router.get("/graph", response_model=GraphResponse)
 async def get_graph():
-    return {
-        "nodes": list(nodes.values()),
-        "edges": [e.model_dump() for e in edges],
-        "rules": [r.model_dump() for r in rules],
-        "syndromes": [s.model_dump() for s in loader.syndromes],
-    }
+    # With a response_model, FastAPI validates the returned model and has pydantic serialize
+    # it (straight to JSON bytes on recent releases, via a JSON-ready dict on older ones)
+    # instead of walking the whole graph through jsonable_encoder.
+    return GraphResponse(
+        nodes=list(nodes.values()),
+        edges=edges,
+        rules=rules,
+        syndromes=loader.syndromes,
+    )
 
 @router.post("/simulate", response_model=SimulationResponse)
 async def simulate(request: SimulationRequest):
@@ -127,8 +134,7 @@ async def compare_simulations(request: CompareSimulationRequest):
             }
         )
 
-        baseline_res = engine.simulate(baseline_request)
-        intervention_res = engine.simulate(intervention_request)
+        baseline_res, intervention_res = engine.simulate_batch([baseline_request, intervention_request])
 
         baseline_map = _index_affected_by_node(baseline_res.affected_nodes)
         intervention_map = _index_affected_by_node(intervention_res.affected_nodes)
@@ -150,5 +156,5 @@ async def compare_simulations(request: CompareSimulationRequest):
 
 @router.post("/reload")
 async def reload_graph():
-    _reload_engine_state()
+    _reload_engine_state(force=True)
     return {"status": "success", "node_count": len(nodes), "syndrome_count": len(loader.syndromes)}
@@ -38,22 +38,28 @@ CONTEXT_BASELINE_EFFECTS: Dict[str, List[Tuple[str, str]]] = {
 }
 
 
+# Perturbations are immutable, so each context's defaults are built once and shared.
+_CONTEXT_TABLE: Dict[str, Tuple[Perturbation, ...]] = {
+    context_id: tuple(Perturbation(node_id=node_id, op=op) for node_id, op in effects)
+    for context_id, effects in CONTEXT_BASELINE_EFFECTS.items()
+}
+
+
 def apply_context_baselines(
     perturbations: List[Perturbation], context: Dict[str, bool]
 ) -> List[Perturbation]:
     merged: List[Perturbation] = list(perturbations)
-    user_nodes: Set[str] = {p.node_id for p in perturbations}
-    added_nodes: Set[str] = set()
+    # Explicit user inputs win over context defaults for the same node.
+    seen_nodes: Set[str] = {p.node_id for p in perturbations}
 
-    for context_id, effects in CONTEXT_BASELINE_EFFECTS.items():
+    for context_id, defaults in _CONTEXT_TABLE.items():
         if not context.get(context_id, False):
             continue
 
-        for node_id, op in effects:
-            # Explicit user inputs win over context defaults for the same node.
-            if node_id in user_nodes or node_id in added_nodes:
+        for perturbation in defaults:
+            if perturbation.node_id in seen_nodes:
                 continue
-            merged.append(Perturbation(node_id=node_id, op=op))
-            added_nodes.add(node_id)
+            merged.append(perturbation)
+            seen_nodes.add(perturbation.node_id)
 
     return merged
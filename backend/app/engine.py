@@ -1,6 +1,10 @@
+import bisect
 import collections
 import heapq
-from typing import Any, DefaultDict, Dict, List, Optional, Set, Tuple
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional, Set, Tuple
 
 from .models import (
     AffectedNode,
@@ -16,6 +20,12 @@ from .models import (
 
 TIME_MAP = {"immediate": 0, "minutes": 1, "hours": 2, "days": 3}
 REV_TIME_MAP = {value: key for key, value in TIME_MAP.items()}
+SIMULATION_CACHE_SIZE = 256
+# (edge, time gain, {source direction: (target direction, step description)}) for one outgoing edge.
+PropagationEntry = Tuple[CompiledEdge, float, Dict[str, Tuple[str, str]]]
+# Lower bounds of the small/medium/large buckets; anything below the first is "none".
+MAGNITUDE_THRESHOLDS = (0.10, 0.30, 0.65)
+MAGNITUDE_LABELS = ("none", "small", "medium", "large")
 POSITIVE_RELATIONS = {
     "increases",
     "converts_to",
@@ -27,10 +37,80 @@ POSITIVE_RELATIONS = {
     "refines",
     "derives",
 }
+# (source direction, relation) -> target direction: "decreases" flips up/down, every other
+# relation preserves it, and unknown/unchanged pass through untouched.
+PROPAGATED_DIRECTION: Dict[Tuple[str, str], str] = {
+    (direction, rel): (
+        direction
+        if direction in ("unknown", "unchanged") or rel in POSITIVE_RELATIONS
+        else {"up": "down", "down": "up"}[direction]
+    )
+    for direction in ("up", "down", "unknown", "unchanged")
+    for rel in (*sorted(POSITIVE_RELATIONS), "decreases")
+}
+
+
+class LazyReachability(Mapping):
+    """Read-only node -> timescale -> ids view of multi-hop reachability.
+
+    The per-tick bitmasks are computed on first access and each node's buckets are
+    decoded only when that node is looked up, so callers that read a handful of nodes
+    never pay for the whole closure. Use ``to_dict()`` for a plain, serializable copy.
+    """
+
+    def __init__(
+        self,
+        node_ids: List[str],
+        node_index: Dict[str, int],
+        compute_masks: Callable[[], List[List[int]]],
+        decode_mask: Callable[[int], List[str]],
+    ):
+        self._node_ids = node_ids
+        self._node_set = set(node_ids)
+        self._node_index = node_index
+        self._compute_masks = compute_masks
+        self._decode_mask = decode_mask
+        self._reach_by_tick: Optional[List[List[int]]] = None
+        self._buckets: Dict[str, Dict[str, List[str]]] = {}
+
+    def __getitem__(self, node_id: str) -> Dict[str, List[str]]:
+        bucket = self._buckets.get(node_id)
+        if bucket is not None:
+            return bucket
+        if node_id not in self._node_set:
+            raise KeyError(node_id)
+        if self._reach_by_tick is None:
+            self._reach_by_tick = self._compute_masks()
+        # Nodes are bits in an int at their node_index handle, so decoding a mask
+        # low-bit-first yields an already sorted id list.
+        idx = self._node_index[node_id]
+        bucket = {timescale: [] for timescale in TIME_MAP}
+        previous = 1 << idx
+        for tick, reach in enumerate(self._reach_by_tick):
+            # Nodes first reachable at exactly this tick.
+            bucket[REV_TIME_MAP[tick]] = self._decode_mask(reach[idx] & ~previous)
+            previous = reach[idx]
+        self._buckets[node_id] = bucket
+        return bucket
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node_ids)
+
+    def __len__(self) -> int:
+        return len(self._node_ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._node_set
+
+    def to_dict(self) -> Dict[str, Dict[str, List[str]]]:
+        return {node_id: self[node_id] for node_id in self._node_ids}
+
 
 class ReasoningEngine:
     def __init__(self, nodes: Dict[str, Node], edges: List[Edge], syndromes: Optional[List[Syndrome]] = None):
-        self.nodes = nodes
+        # Node ids are interned so the id strings held by nodes, compiled edges, paths and
+        # per-run dicts are one object each and key comparisons short-circuit on identity.
+        self.nodes = {sys.intern(node_id): node for node_id, node in nodes.items()}
         self.edges = edges
         self.syndromes = syndromes or []
         # Backward-compatible snapshot of per-tick resolved states from the latest simulation.
@@ -38,15 +118,155 @@ class ReasoningEngine:
         self.compiled_edges = self._compile_edges(edges)
         self.adj: DefaultDict[str, List[CompiledEdge]] = collections.defaultdict(list)
         self.rev_adj: DefaultDict[str, List[CompiledEdge]] = collections.defaultdict(list)
+        # Integer handles for every node id the graph mentions, numbered in sorted id order so
+        # that ascending handles are ascending ids. Used by the bitset-based graph analyses.
+        self.node_names: List[str] = sorted(
+            set(self.nodes).union(
+                endpoint for edge in self.compiled_edges for endpoint in (edge.source, edge.target)
+            )
+        )
+        self.node_index: Dict[str, int] = {node_id: idx for idx, node_id in enumerate(self.node_names)}
+        # Phase -> node -> compiled edges leaving (outgoing) or entering (incoming) that node.
+        self.outgoing_by_phase: Dict[str, DefaultDict[str, List[CompiledEdge]]] = {
+            timescale: collections.defaultdict(list) for timescale in TIME_MAP
+        }
+        self.incoming_by_phase: Dict[str, DefaultDict[str, List[CompiledEdge]]] = {
+            timescale: collections.defaultdict(list) for timescale in TIME_MAP
+        }
         for edge in self.compiled_edges:
             self.adj[edge.source].append(edge)
             self.rev_adj[edge.target].append(edge)
+            self.outgoing_by_phase[edge.at][edge.source].append(edge)
+            self.incoming_by_phase[edge.at][edge.target].append(edge)
+        # Static propagation inputs resolved once per graph rather than on every edge visit:
+        # outgoing edges paired with their source time-constant gain and the target direction
+        # and step text for each source direction, and each node's (baseline, min, max) bounds.
+        self._propagation_adj: Dict[str, List[PropagationEntry]] = {
+            source_id: [
+                (
+                    edge,
+                    1.0 if not edge.is_legacy_timing else self._time_constant_gain(source_id),
+                    self._edge_outcomes(edge),
+                )
+                for edge in outgoing
+            ]
+            for source_id, outgoing in self.adj.items()
+        }
+        # Outgoing edges bucketed by how many ticks of delay they need. A node resolved at
+        # `tick` can only schedule edges with at_tick <= max_tick - tick, so the hop loop
+        # picks the matching horizon and never visits phases that would land past the window.
+        self._propagation_adj_by_horizon: List[Dict[str, List[PropagationEntry]]] = [
+            {
+                source_id: [entry for entry in outgoing if entry[0].at_tick <= horizon]
+                for source_id, outgoing in self._propagation_adj.items()
+            }
+            for horizon in range(TIME_MAP["days"] + 1)
+        ]
+        self._node_levels: Dict[str, Tuple[float, float, float]] = {
+            node_id: (node.baseline_level, node.min_level, node.max_level)
+            for node_id, node in self.nodes.items()
+        }
+        # Context keys that gate at least one edge; contexts that agree on these share
+        # the same filtered adjacency, which is built once and memoized per engine.
+        self._context_keys: Tuple[str, ...] = tuple(
+            sorted({key for edge in self.compiled_edges for key in edge.context})
+        )
+        self._context_adjacency_cache: Dict[
+            Tuple[Any, ...],
+            Tuple[List[Dict[str, List[Tuple[CompiledEdge, float]]]], Dict[str, List[CompiledEdge]]],
+        ] = {}
+        # LRU of finished simulations keyed by everything that can change the outcome.
+        self._simulation_cache: "collections.OrderedDict[Tuple[Any, ...], SimulationResponse]" = (
+            collections.OrderedDict()
+        )
+        # Guards the LRU bookkeeping only; simulations themselves run unlocked, so one engine
+        # can serve concurrent requests. Each response carries its own run's node_states;
+        # the latest_node_states attribute is last-writer-wins and is only for serial callers.
+        self._simulation_cache_lock = threading.Lock()
+        # Dependency reports per bounded max_tick; the graph is fixed for the engine's lifetime.
+        self._dependency_index_cache: Dict[int, Dict[str, Any]] = {}
 
     def simulate(self, request: SimulationRequest) -> SimulationResponse:
+        return self.simulate_batch([request])[0]
+
+    def simulate_batch(self, requests: List[SimulationRequest]) -> List[SimulationResponse]:
+        """Run several independent simulations against this graph.
+
+        Requests that share a clinical context reuse one context-filtered adjacency, and
+        repeated requests are served from an LRU cache; cached responses are shared, so
+        treat them as read-only. latest_node_states reflects the last request in the batch
+        when the engine is not shared; concurrent callers should read response.node_states.
+        """
+        responses: List[SimulationResponse] = []
+        for request in requests:
+            key = self._simulation_key(request)
+            with self._simulation_cache_lock:
+                response = self._simulation_cache.get(key)
+                if response is not None:
+                    self._simulation_cache.move_to_end(key)
+            if response is None:
+                response = self._simulate_one(request, *self._context_adjacency(request.context))
+                with self._simulation_cache_lock:
+                    self._simulation_cache[key] = response
+                    if len(self._simulation_cache) > SIMULATION_CACHE_SIZE:
+                        self._simulation_cache.popitem(last=False)
+            else:
+                self.latest_node_states = response.node_states
+            responses.append(response)
+        return responses
+
+    def reset_cache(self) -> None:
+        """Drop memoized simulations, e.g. after mutating nodes or edges in place."""
+        with self._simulation_cache_lock:
+            self._simulation_cache.clear()
+        self._context_adjacency_cache.clear()
+        self._dependency_index_cache.clear()
+
+    def _simulation_key(self, request: SimulationRequest) -> Tuple[Any, ...]:
+        # Perturbation order is kept: it decides tie-breaks between equal influences.
+        # Only context keys that gate an edge can change the result.
+        return (
+            tuple((p.node_id, p.op, p.value) for p in request.perturbations),
+            tuple(request.context.get(context_key, False) for context_key in self._context_keys),
+            tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in request.options.model_dump().items()
+            ),
+        )
+
+    def _context_adjacency(
+        self,
+        context: Dict[str, bool],
+    ) -> Tuple[List[Dict[str, List[PropagationEntry]]], Dict[str, List[PropagationEntry]]]:
+        key = tuple(context.get(context_key, False) for context_key in self._context_keys)
+        cached = self._context_adjacency_cache.get(key)
+        if cached is not None:
+            return cached
+
+        adjacency_by_horizon = [
+            {
+                source_id: [entry for entry in outgoing if self._context_matches(entry[0], context)]
+                for source_id, outgoing in horizon_adj.items()
+            }
+            for horizon_adj in self._propagation_adj_by_horizon
+        ]
+        trace_adj = {
+            source_id: [entry for entry in outgoing if self._context_matches(entry[0], context)]
+            for source_id, outgoing in self._propagation_adj.items()
+        }
+        self._context_adjacency_cache[key] = (adjacency_by_horizon, trace_adj)
+        return adjacency_by_horizon, trace_adj
+
+    def _simulate_one(
+        self,
+        request: SimulationRequest,
+        adjacency_by_horizon: List[Dict[str, List[PropagationEntry]]],
+        trace_adj: Dict[str, List[PropagationEntry]],
+    ) -> SimulationResponse:
         # node_states: node_id -> tick -> AffectedNode
         node_states: DefaultDict[str, Dict[int, AffectedNode]] = collections.defaultdict(dict)
         node_activity: Dict[str, Dict[int, float]] = collections.defaultdict(dict)
-        traces: DefaultDict[str, List[TraceStep]] = collections.defaultdict(list)
+        traces: DefaultDict[str, List[Tuple[float, List[str], List[str]]]] = collections.defaultdict(list)
         propagated_directions: DefaultDict[str, DefaultDict[int, Set[str]]] = collections.defaultdict(
             lambda: collections.defaultdict(set)
         )
@@ -57,31 +277,45 @@ class ReasoningEngine:
         influence_buffer: DefaultDict[str, DefaultDict[int, List[Dict[str, Any]]]] = collections.defaultdict(
             lambda: collections.defaultdict(list)
         )
+        # pending_nodes: tick -> node ids with buffered influences at that tick.
+        # Influences below min_confidence/min_effect_size are never buffered, so this is the live frontier.
+        pending_nodes: DefaultDict[int, Set[str]] = collections.defaultdict(set)
 
         # Initial perturbations (Tick 0)
         for p in request.perturbations:
             direction = "up" if p.op == "increase" else "down" if p.op in {"decrease", "block"} else "unchanged"
-            if p.node_id not in self.nodes:
+            node_id = sys.intern(p.node_id)
+            if node_id not in self.nodes:
                 continue
 
-            influence_buffer[p.node_id][0].append({
+            influence_buffer[node_id][0].append({
                 "direction": direction,
                 "confidence": 1.0,
                 "effect_size": 1.0,
                 "priority": "ultra", # Manual is ultra high
-                "path": [p.node_id],
+                "path": [node_id],
                 "steps": [],
             })
+            pending_nodes[0].add(node_id)
+
+        target_nodes = request.options.target_nodes
 
         # Process ticks sequentially
         for tick in range(max_tick + 1):
-            nodes_to_resolve = sorted(
-                node_id for node_id, tick_bucket in influence_buffer.items() if tick in tick_bucket
-            )
+            if target_nodes and all(node_states.get(target_id) for target_id in target_nodes):
+                # Earlier ticks are final, so every target's earliest state is settled.
+                break
+            if not any(pending_tick >= tick for pending_tick in pending_nodes):
+                # Nothing is scheduled for this or any later tick.
+                break
+            propagation_adj = adjacency_by_horizon[max_tick - tick]
+            # Min-heap of node ids: nodes resolve in id order, and immediate-phase targets
+            # join the same tick without re-sorting the whole frontier.
+            nodes_to_resolve = sorted(pending_nodes.pop(tick, ()))
             queued_nodes = set(nodes_to_resolve)
 
             while nodes_to_resolve:
-                curr_node_id = nodes_to_resolve.pop(0)
+                curr_node_id = heapq.heappop(nodes_to_resolve)
                 queued_nodes.discard(curr_node_id)
                 if tick not in influence_buffer[curr_node_id]:
                     continue
@@ -118,8 +352,7 @@ class ReasoningEngine:
                         traces=traces,
                         source_id=curr_node_id,
                         source_branch=branch,
-                        outgoing_edges=self.adj.get(curr_node_id, []),
-                        context=request.context,
+                        outgoing_edges=trace_adj.get(curr_node_id, []),
                         min_confidence=request.options.min_confidence,
                     )
 
@@ -127,24 +360,25 @@ class ReasoningEngine:
                 if not can_propagate:
                     continue
                 propagated_directions[curr_node_id][tick].add(resolved.direction)
-                for edge in self.adj.get(curr_node_id, []):
-                    if not self._context_matches(edge, request.context):
-                        continue
 
-                    source_dir_for_path = dominant_influence["direction"] if dominant_influence else resolved.direction
-                    target_id = edge.target
-                    target_dir = self._propagate_direction(source_dir_for_path, edge.rel)
-                    if target_dir in {"unknown", "unchanged"}:
+                # Everything that depends only on the source node is fixed for this fan-out.
+                source_dir_for_path = dominant_influence["direction"] if dominant_influence else resolved.direction
+                source_level = self._source_level(curr_node_id, tick, node_activity)
+                source_strength = abs(source_level)
+                saturation_gain = self._saturation_gain(curr_node_id, source_dir_for_path, source_level)
+                previous_path = dominant_influence["path"] if dominant_influence else [curr_node_id]
+                previous_steps = dominant_influence["steps"] if dominant_influence else []
+
+                for edge, time_gain, outcomes in propagation_adj.get(curr_node_id, ()):
+                    outcome = outcomes.get(source_dir_for_path)
+                    if outcome is None:
                         continue
-
-                    source_level = self._source_level(curr_node_id, tick, node_activity)
-                    source_strength = abs(source_level)
+                    target_id = edge.target
+                    target_dir, step_desc = outcome
 
                     threshold_gain = self._activation_threshold_gain(edge, source_dir_for_path, source_strength)
                     if threshold_gain <= 0.0:
                         continue
-                    saturation_gain = self._saturation_gain(curr_node_id, source_dir_for_path, source_level)
-                    time_gain = 1.0 if not edge.is_legacy_timing else self._time_constant_gain(curr_node_id)
                     target_effect_size = self._clamp(
                         resolved.effect_size * edge.weight * threshold_gain * saturation_gain * time_gain
                     )
@@ -159,20 +393,8 @@ class ReasoningEngine:
                         continue
 
                     next_tick = tick + edge.at_tick
-                    if next_tick > max_tick:
-                        continue
 
-                    previous_path = dominant_influence["path"] if dominant_influence else [curr_node_id]
-                    previous_steps = dominant_influence["steps"] if dominant_influence else []
                     path = previous_path + [target_id]
-                    step_desc = self._generate_step_description(
-                        curr_node_id,
-                        target_id,
-                        source_dir_for_path,
-                        target_dir,
-                        edge.rel,
-                        edge.at,
-                    )
                     steps = previous_steps + [step_desc]
 
                     influence_buffer[target_id][next_tick].append({
@@ -183,12 +405,12 @@ class ReasoningEngine:
                         "path": path,
                         "steps": steps,
                     })
+                    pending_nodes[next_tick].add(target_id)
 
                     self._upsert_trace(traces, target_id, path, steps, target_conf)
 
                     if edge.at_tick == 0 and target_id not in queued_nodes:
-                        nodes_to_resolve.append(target_id)
-                        nodes_to_resolve.sort()
+                        heapq.heappush(nodes_to_resolve, target_id)
                         queued_nodes.add(target_id)
 
         # Build response
@@ -203,22 +425,34 @@ class ReasoningEngine:
                 all_affected.append(tick_states[best_tick])
 
         # Preserve full timeline for debugging scripts/tests that inspect tick-level states.
-        self.latest_node_states = {
-            node_id: dict(tick_states)
-            for node_id, tick_states in node_states.items()
-        }
+        # node_states is local to this run, so the per-node tick dicts are handed over as-is.
+        run_states = dict(node_states)
+        self.latest_node_states = run_states
 
-        return SimulationResponse(
+        response = SimulationResponse(
             affected_nodes=all_affected,
-            traces=dict(traces),
+            traces=self._materialize_traces(traces),
             timelines=timelines,
             max_ticks=max_tick
         )
+        # Callers sharing one engine across threads or workers should read this copy; it is
+        # taken from the local, since another run may have replaced latest_node_states by now.
+        response._node_states = run_states
+        return response
 
     def build_dependency_index(self, max_tick: int = 3) -> Dict[str, Any]:
         bounded_max_tick = max(0, min(max_tick, TIME_MAP["days"]))
-        direct_downstream = self._group_direct_neighbors(self.adj, "target")
-        direct_upstream = self._group_direct_neighbors(self.rev_adj, "source")
+        cached = self._dependency_index_cache.get(bounded_max_tick)
+        if cached is None:
+            cached = self._compute_dependency_index(bounded_max_tick)
+            self._dependency_index_cache[bounded_max_tick] = cached
+        # Callers may replace top-level sections (the audit script filters them), so hand
+        # out a fresh outer dict; the section contents are shared and read-only.
+        return dict(cached)
+
+    def _compute_dependency_index(self, bounded_max_tick: int) -> Dict[str, Any]:
+        direct_downstream = self._group_direct_neighbors(self.outgoing_by_phase, "target")
+        direct_upstream = self._group_direct_neighbors(self.incoming_by_phase, "source")
         multi_hop_downstream = self._group_reachability(self.adj, bounded_max_tick, "target")
         multi_hop_upstream = self._group_reachability(self.rev_adj, bounded_max_tick, "source")
         logical_adj = self._logical_adjacency()
@@ -237,44 +471,68 @@ class ReasoningEngine:
 
     def _upsert_trace(
         self,
-        traces: Dict[str, List[TraceStep]],
+        traces: Dict[str, List[Tuple[float, List[str], List[str]]]],
         target_id: str,
         path: List[str],
         steps: List[str],
         confidence: float,
     ) -> None:
-        summary = self._build_trace_summary(path)
-        new_trace = TraceStep(
-            path=path,
-            steps=steps,
-            confidence=confidence,
-            summary=summary,
-        )
+        # Candidates stay as (confidence, path, steps) tuples during propagation;
+        # TraceStep models and syndrome summaries are only built for the survivors.
+        new_trace = (confidence, path, steps)
 
         if target_id not in traces:
             traces[target_id] = [new_trace]
             return
 
+        candidates = traces[target_id]
         path_exists = False
-        for i, existing in enumerate(traces[target_id]):
-            if existing.path == path:
-                if confidence > existing.confidence:
-                    traces[target_id][i] = new_trace
+        for i, existing in enumerate(candidates):
+            if existing[1] == path:
+                if confidence > existing[0]:
+                    candidates[i] = new_trace
                 path_exists = True
                 break
 
         if not path_exists:
-            traces[target_id].append(new_trace)
+            candidates.append(new_trace)
 
-        traces[target_id].sort(key=lambda x: (x.confidence, len(x.path)), reverse=True)
-        traces[target_id] = traces[target_id][:10]
+        candidates.sort(key=lambda x: (x[0], len(x[1])), reverse=True)
+        del candidates[10:]
+
+    def _materialize_traces(
+        self,
+        traces: Dict[str, List[Tuple[float, List[str], List[str]]]],
+    ) -> Dict[str, List[TraceStep]]:
+        summaries: Dict[Tuple[str, ...], Optional[str]] = {}
+        materialized: Dict[str, List[TraceStep]] = {}
+        for target_id, candidates in traces.items():
+            steps_out: List[TraceStep] = []
+            for confidence, path, steps in candidates:
+                path_key = tuple(path)
+                if path_key not in summaries:
+                    summaries[path_key] = self._build_trace_summary(path)
+                steps_out.append(
+                    TraceStep(
+                        path=path,
+                        steps=steps,
+                        confidence=confidence,
+                        summary=summaries[path_key],
+                    )
+                )
+            materialized[target_id] = steps_out
+        return materialized
 
     def _build_trace_summary(self, path: List[str]) -> Optional[str]:
         if not path or len(path) < 2:
             return None
 
         matched_items: List[Tuple[int, int, str]] = []
+        path_nodes = set(path)
         for syndrome in self.syndromes:
+            # A syndrome can only match if its opening node is somewhere on the path.
+            if not syndrome.sequence or syndrome.sequence[0] not in path_nodes:
+                continue
             span = self._subsequence_span(path, syndrome.sequence)
             if span is not None:
                 matched_items.append((span[0], span[1], syndrome.label))
@@ -395,21 +653,19 @@ class ReasoningEngine:
 
     def _emit_secondary_trace_branches(
         self,
-        traces: Dict[str, List[TraceStep]],
+        traces: Dict[str, List[Tuple[float, List[str], List[str]]]],
         source_id: str,
         source_branch: Dict[str, Any],
-        outgoing_edges: List[CompiledEdge],
-        context: Dict[str, bool],
+        outgoing_edges: List[PropagationEntry],
         min_confidence: float,
     ) -> None:
+        # outgoing_edges is already filtered to the request's context.
         if source_branch["effect_size"] <= 0.0:
             return
 
-        for edge in outgoing_edges:
-            if not self._context_matches(edge, context):
-                continue
-            target_dir = self._propagate_direction(source_branch["direction"], edge.rel)
-            if target_dir in {"unknown", "unchanged"}:
+        for edge, _, outcomes in outgoing_edges:
+            outcome = outcomes.get(source_branch["direction"])
+            if outcome is None:
                 continue
 
             trace_confidence = self._clamp(source_branch["confidence"] * 0.7, floor=0.0)
@@ -417,18 +673,28 @@ class ReasoningEngine:
                 continue
 
             path = source_branch["path"] + [edge.target]
-            steps = source_branch["steps"] + [
-                self._generate_step_description(
-                    source_id,
-                    edge.target,
-                    source_branch["direction"],
-                    target_dir,
-                    edge.rel,
-                    edge.at,
-                )
-            ]
+            steps = source_branch["steps"] + [outcome[1]]
             self._upsert_trace(traces, edge.target, path, steps, trace_confidence)
 
+    def _edge_outcomes(self, edge: CompiledEdge) -> Dict[str, Tuple[str, str]]:
+        # Only "up"/"down" sources propagate, so each edge has at most two possible outcomes.
+        outcomes: Dict[str, Tuple[str, str]] = {}
+        for source_dir in ("up", "down"):
+            target_dir = self._propagate_direction(source_dir, edge.rel)
+            if target_dir in {"unknown", "unchanged"}:
+                continue
+            outcomes[source_dir] = (
+                target_dir,
+                self._generate_step_description(
+                    edge.source, edge.target, source_dir, target_dir, edge.rel, edge.at
+                ),
+            )
+        return outcomes
+
+    def _node_label(self, node_id: str) -> str:
+        node = self.nodes.get(node_id)
+        return node.label if node is not None else node_id
+
     def _generate_step_description(
         self,
         source_id: str,
@@ -438,8 +704,9 @@ class ReasoningEngine:
         rel: str,
         timescale: str,
     ) -> str:
-        source_label = self.nodes[source_id].label
-        target_label = self.nodes[target_id].label
+        # Edges may point at ids with no Node (node_names keeps them), so fall back to the id.
+        source_label = self._node_label(source_id)
+        target_label = self._node_label(target_id)
         target_state = "Increased" if target_dir == "up" else "Decreased" if target_dir == "down" else target_dir
         timing_prefix = ""
         if timescale != "immediate":
@@ -473,24 +740,24 @@ class ReasoningEngine:
         return 1.0 if source_strength >= edge.activation_threshold else 0.0
 
     def _source_level(self, node_id: str, tick: int, node_activity: Dict[str, Dict[int, float]]) -> float:
-        node = self.nodes[node_id]
+        baseline_level, min_level, max_level = self._node_levels[node_id]
         activity = node_activity.get(node_id, {}).get(tick, 0.0)
-        level = node.baseline_level + activity
-        return max(node.min_level, min(node.max_level, level))
+        level = baseline_level + activity
+        return max(min_level, min(max_level, level))
 
     def _saturation_gain(self, node_id: str, source_dir: str, source_level: float) -> float:
-        node = self.nodes[node_id]
+        _, min_level, max_level = self._node_levels[node_id]
         # Only apply saturation where the node explicitly constrains its dynamic range.
-        if node.min_level <= -1.0 and node.max_level >= 1.0:
+        if min_level <= -1.0 and max_level >= 1.0:
             return 1.0
         if source_dir == "down":
             # Only damp when already close to the lower floor.
-            if source_level <= node.min_level + 0.05:
+            if source_level <= min_level + 0.05:
                 return 0.05
             return 1.0
         if source_dir == "up":
             # Only damp when already close to the upper ceiling.
-            if source_level >= node.max_level - 0.05:
+            if source_level >= max_level - 0.05:
                 return 0.05
             return 1.0
         return 1.0
@@ -504,13 +771,10 @@ class ReasoningEngine:
         return 0.5
 
     def _propagate_direction(self, direction: str, rel: str) -> str:
-        if direction == "unknown" or direction == "unchanged":
-            return direction
-        if rel in POSITIVE_RELATIONS:
-            return direction
-        if rel == "decreases":
-            return "down" if direction == "up" else "up"
-        return "unknown"
+        propagated = PROPAGATED_DIRECTION.get((direction, rel))
+        if propagated is not None:
+            return propagated
+        return direction if direction in ("unknown", "unchanged") else "unknown"
 
     def _compile_edges(self, edges: List[Edge]) -> List[CompiledEdge]:
         compiled: List[CompiledEdge] = []
@@ -519,8 +783,8 @@ class ReasoningEngine:
             for phase in phases:
                 compiled.append(
                     CompiledEdge(
-                        source=edge.source,
-                        target=edge.target,
+                        source=sys.intern(edge.source),
+                        target=sys.intern(edge.target),
                         at=phase.at,
                         at_tick=TIME_MAP[phase.at],
                         rel=phase.rel or edge.rel,
@@ -540,30 +804,21 @@ class ReasoningEngine:
         return compiled
 
     def _effect_size_to_magnitude(self, effect_size: float) -> str:
-        if effect_size < 0.10:
-            return "none"
-        if effect_size < 0.30:
-            return "small"
-        if effect_size < 0.65:
-            return "medium"
-        return "large"
+        return MAGNITUDE_LABELS[bisect.bisect_right(MAGNITUDE_THRESHOLDS, effect_size)]
 
     def _clamp(self, value: float, floor: float = 0.0, ceiling: float = 1.0) -> float:
         return max(floor, min(ceiling, value))
 
     def _group_direct_neighbors(
         self,
-        adjacency: Dict[str, List[CompiledEdge]],
+        adjacency_by_phase: Dict[str, DefaultDict[str, List[CompiledEdge]]],
         neighbor_field: str,
     ) -> Dict[str, Dict[str, List[str]]]:
         grouped: Dict[str, Dict[str, List[str]]] = {}
         for node_id in self.nodes:
-            bucket = {timescale: set() for timescale in TIME_MAP}
-            for edge in adjacency.get(node_id, []):
-                bucket[edge.at].add(getattr(edge, neighbor_field))
             grouped[node_id] = {
-                timescale: sorted(values)
-                for timescale, values in bucket.items()
+                timescale: sorted({getattr(edge, neighbor_field) for edge in by_node.get(node_id, ())})
+                for timescale, by_node in adjacency_by_phase.items()
             }
         return grouped
 
@@ -572,107 +827,149 @@ class ReasoningEngine:
         adjacency: Dict[str, List[CompiledEdge]],
         max_tick: int,
         neighbor_field: str,
-    ) -> Dict[str, Dict[str, List[str]]]:
-        grouped: Dict[str, Dict[str, List[str]]] = {}
-        for node_id in self.nodes:
-            earliest = self._reachable_by_timescale(node_id, adjacency, max_tick, neighbor_field)
-            bucket = {timescale: [] for timescale in TIME_MAP}
-            for target_id, tick in earliest.items():
-                bucket[REV_TIME_MAP[tick]].append(target_id)
-            grouped[node_id] = {
-                timescale: sorted(values)
-                for timescale, values in bucket.items()
-            }
-        return grouped
+    ) -> LazyReachability:
+        return LazyReachability(
+            list(self.nodes),
+            self.node_index,
+            lambda: self._reachability_masks(adjacency, max_tick, neighbor_field),
+            self._decode_mask,
+        )
 
-    def _reachable_by_timescale(
+    def _reachability_masks(
         self,
-        start: str,
         adjacency: Dict[str, List[CompiledEdge]],
         max_tick: int,
         neighbor_field: str,
-    ) -> Dict[str, int]:
-        best_tick: Dict[str, int] = {start: 0}
-        heap: List[Tuple[int, str]] = [(0, start)]
-
-        while heap:
-            current_tick, node_id = heapq.heappop(heap)
-            if current_tick > best_tick.get(node_id, max_tick + 1):
-                continue
-            for edge in adjacency.get(node_id, []):
-                neighbor = getattr(edge, neighbor_field)
-                next_tick = current_tick + edge.at_tick
-                if next_tick > max_tick:
-                    continue
-                if next_tick >= best_tick.get(neighbor, max_tick + 1):
-                    continue
-                best_tick[neighbor] = next_tick
-                heapq.heappush(heap, (next_tick, neighbor))
-
-        best_tick.pop(start, None)
-        return best_tick
-
-    def _logical_adjacency(self) -> Dict[str, Set[str]]:
-        adjacency: Dict[str, Set[str]] = {node_id: set() for node_id in self.nodes}
+    ) -> List[List[int]]:
+        """reach_by_tick[t][u] is the bitmask of nodes reachable from u with total delay <= t.
+
+        Each tick's masks are the zero-delay closure of (u | reach_by_tick[t - d][v] for
+        every delayed edge u -> v of delay d <= t), so every level is a few wide ORs per edge.
+        """
+        node_index = self.node_index
+        zero_delay: List[List[int]] = [[] for _ in self.node_names]
+        delayed: List[List[Tuple[int, int]]] = [[] for _ in self.node_names]
+        for node_id, outgoing in adjacency.items():
+            idx = node_index[node_id]
+            for edge in outgoing:
+                neighbor = node_index[getattr(edge, neighbor_field)]
+                if edge.at_tick == 0:
+                    zero_delay[idx].append(neighbor)
+                else:
+                    delayed[idx].append((neighbor, edge.at_tick))
+
+        reach_by_tick: List[List[int]] = []
+        for tick in range(max_tick + 1):
+            reach = [1 << idx for idx in range(len(self.node_names))]
+            for idx, edges in enumerate(delayed):
+                for neighbor, delay in edges:
+                    if delay <= tick:
+                        reach[idx] |= reach_by_tick[tick - delay][neighbor]
+            changed = True
+            while changed:
+                changed = False
+                for idx, neighbors in enumerate(zero_delay):
+                    mask = reach[idx]
+                    for neighbor in neighbors:
+                        mask |= reach[neighbor]
+                    if mask != reach[idx]:
+                        reach[idx] = mask
+                        changed = True
+            reach_by_tick.append(reach)
+        return reach_by_tick
+
+    def _decode_mask(self, mask: int) -> List[str]:
+        decoded: List[str] = []
+        while mask:
+            low_bit = mask & -mask
+            decoded.append(self.node_names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return decoded
+
+    def _logical_adjacency(self) -> List[List[int]]:
+        # Successor handles per node_index handle, deduplicated in edge order.
+        adjacency: List[List[int]] = [[] for _ in self.node_names]
+        seen: Set[Tuple[int, int]] = set()
+        node_index = self.node_index
         for edge in self.edges:
-            adjacency.setdefault(edge.source, set()).add(edge.target)
-            adjacency.setdefault(edge.target, set())
+            pair = (node_index[edge.source], node_index[edge.target])
+            if pair not in seen:
+                seen.add(pair)
+                adjacency[pair[0]].append(pair[1])
         return adjacency
 
-    def _strongly_connected_components(self, adjacency: Dict[str, Set[str]]) -> List[List[str]]:
-        index = 0
-        stack: List[str] = []
-        on_stack: Set[str] = set()
-        indexes: Dict[str, int] = {}
-        lowlinks: Dict[str, int] = {}
+    def _strongly_connected_components(self, adjacency: List[List[int]]) -> List[List[str]]:
+        """Iterative Tarjan over integer handles; keeps cycles and self-loops only."""
+        unvisited = -1
+        indexes = [unvisited] * len(adjacency)
+        lowlinks = [0] * len(adjacency)
+        on_stack = [False] * len(adjacency)
+        stack: List[int] = []
         components: List[List[str]] = []
+        index = 0
 
-        def strongconnect(node_id: str) -> None:
-            nonlocal index
-            indexes[node_id] = index
-            lowlinks[node_id] = index
+        for root in range(len(adjacency)):
+            if indexes[root] != unvisited:
+                continue
+            indexes[root] = lowlinks[root] = index
             index += 1
-            stack.append(node_id)
-            on_stack.add(node_id)
-
-            for neighbor in adjacency.get(node_id, set()):
-                if neighbor not in indexes:
-                    strongconnect(neighbor)
-                    lowlinks[node_id] = min(lowlinks[node_id], lowlinks[neighbor])
-                elif neighbor in on_stack:
-                    lowlinks[node_id] = min(lowlinks[node_id], indexes[neighbor])
-
-            if lowlinks[node_id] != indexes[node_id]:
-                return
-
-            component: List[str] = []
-            while stack:
-                member = stack.pop()
-                on_stack.remove(member)
-                component.append(member)
-                if member == node_id:
-                    break
-            if len(component) > 1 or node_id in adjacency.get(node_id, set()):
-                components.append(sorted(component))
-
-        for node_id in adjacency:
-            if node_id not in indexes:
-                strongconnect(node_id)
+            stack.append(root)
+            on_stack[root] = True
+            # (node, position of the next successor to visit)
+            work: List[Tuple[int, int]] = [(root, 0)]
+            while work:
+                node, position = work[-1]
+                successors = adjacency[node]
+                if position < len(successors):
+                    work[-1] = (node, position + 1)
+                    neighbor = successors[position]
+                    if indexes[neighbor] == unvisited:
+                        indexes[neighbor] = lowlinks[neighbor] = index
+                        index += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = True
+                        work.append((neighbor, 0))
+                    elif on_stack[neighbor] and indexes[neighbor] < lowlinks[node]:
+                        lowlinks[node] = indexes[neighbor]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlinks[node] < lowlinks[parent]:
+                        lowlinks[parent] = lowlinks[node]
+                if lowlinks[node] != indexes[node]:
+                    continue
+
+                component: List[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in successors:
+                    # Handles follow sorted node ids, so sorting them sorts the names.
+                    components.append([self.node_names[member] for member in sorted(component)])
 
         return sorted(components, key=lambda component: (len(component), component))
 
     def _build_feedback_clusters(self, sccs: List[List[str]]) -> List[Dict[str, Any]]:
+        # Bucket intra-component edges by component in one pass over each edge list.
+        component_of = {node_id: position for position, component in enumerate(sccs) for node_id in component}
+        edges_by_component: List[List[Edge]] = [[] for _ in sccs]
+        compiled_by_component: List[List[CompiledEdge]] = [[] for _ in sccs]
+        for edge in self.edges:
+            position = component_of.get(edge.source)
+            if position is not None and component_of.get(edge.target) == position:
+                edges_by_component[position].append(edge)
+        for compiled in self.compiled_edges:
+            position = component_of.get(compiled.source)
+            if position is not None and component_of.get(compiled.target) == position:
+                compiled_by_component[position].append(compiled)
+
         clusters: List[Dict[str, Any]] = []
-        for component in sccs:
-            node_set = set(component)
-            cluster_edges = [
-                edge for edge in self.edges
-                if edge.source in node_set and edge.target in node_set
-            ]
-            compiled_edges = [
-                edge for edge in self.compiled_edges
-                if edge.source in node_set and edge.target in node_set
-            ]
+        for component, cluster_edges, compiled_edges in zip(sccs, edges_by_component, compiled_by_component):
             if not cluster_edges:
                 continue
 
@@ -721,16 +1018,17 @@ class ReasoningEngine:
             }
         )
 
+        # Phase ticks of every compiled edge between a (source, target) pair, gathered in one pass.
+        phase_ticks_by_pair: DefaultDict[Tuple[str, str], List[int]] = collections.defaultdict(list)
+        for compiled in self.compiled_edges:
+            phase_ticks_by_pair[(compiled.source, compiled.target)].append(compiled.at_tick)
+
         immediate_only_high_weight_edges: List[str] = []
         for edge in self.edges:
-            source_target_phases = [
-                compiled
-                for compiled in self.compiled_edges
-                if compiled.source == edge.source and compiled.target == edge.target
-            ]
-            if not source_target_phases:
+            phase_ticks = phase_ticks_by_pair.get((edge.source, edge.target))
+            if not phase_ticks:
                 continue
-            if not all(compiled.at_tick == 0 for compiled in source_target_phases):
+            if not all(at_tick == 0 for at_tick in phase_ticks):
                 continue
             if edge.weight < 0.7:
                 continue
@@ -1,8 +1,41 @@
+import functools
+import hashlib
 import os
+import pickle
+import sys
+import pydantic
 import yaml
 from typing import List, Dict, Optional
+from . import models
 from .models import Edge, EdgePhase, Node, Rule, Syndrome
 
+# libyaml-backed parser when PyYAML was built with it, pure-Python otherwise.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Development opt-in: set HFP_PACK_CACHE=1 to read and write the parsed-pack cache.
+# Unset (the default, including for the API), the YAML packs are always parsed.
+PACK_CACHE_ENV = "HFP_PACK_CACHE"
+
+# Directory for pack caches; defaults to a per-user cache dir ($XDG_CACHE_HOME/hfp or ~/.cache/hfp).
+PACK_CACHE_DIR_ENV = "HFP_PACK_CACHE_DIR"
+
+
+@functools.lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    # Cached graphs are only valid for the loader and model code (and pydantic) that built
+    # them, so their source is part of every cache signature.
+    digest = hashlib.blake2b(digest_size=16)
+    for module_path in (__file__, models.__file__):
+        with open(module_path, "rb") as f:
+            digest.update(f.read())
+    digest.update(f"pydantic={pydantic.VERSION};python={sys.version_info[:2]}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _intern(value):
+    # Leave non-strings alone so model validation still reports them.
+    return sys.intern(value) if isinstance(value, str) else value
+
 class GraphLoader:
     def __init__(self, packs_dir: str):
         self.packs_dir = packs_dir
@@ -11,6 +44,8 @@ class GraphLoader:
         self.rules: List[Rule] = []
         self.syndromes: List[Syndrome] = []
         self.alias_map: Dict[str, str] = {}
+        # Signature of the pack files behind the currently loaded graph.
+        self.signature: Optional[str] = None
 
     def load_all(self):
         # Reset state to allow for reloads
@@ -20,16 +55,103 @@ class GraphLoader:
         self.syndromes = []
         self.alias_map = {}
 
+        pack_files = self._pack_files()
+        signature = self._signature(pack_files)
+        use_cache = self.cache_enabled()
+        cache_path = self.cache_path()
+        if not (use_cache and self._load_cache(cache_path, signature)):
+            for pack_path in pack_files:
+                self._load_pack(pack_path)
+            self._validate_graph()
+            if use_cache:
+                self._write_cache(cache_path, signature)
+        self.signature = signature
+        return self.nodes, self.edges, self.rules
+
+    def pack_signature(self) -> str:
+        """Hash of the current pack files; differs from `signature` once any pack is edited."""
+        return self._signature(self._pack_files())
+
+    @staticmethod
+    def cache_enabled() -> bool:
+        return os.environ.get(PACK_CACHE_ENV, "0").strip().lower() in {"1", "true", "yes", "on"}
+
+    @staticmethod
+    def cache_dir() -> str:
+        configured = os.environ.get(PACK_CACHE_DIR_ENV)
+        if configured:
+            return configured
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "hfp")
+
+    def cache_path(self) -> str:
+        """Location of the parsed-pack cache; one file per packs directory, rewritten on edits."""
+        packs_key = hashlib.blake2b(
+            os.path.abspath(self.packs_dir).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return os.path.join(self.cache_dir(), f"packs_{packs_key}.pkl")
+
+    def _pack_files(self) -> List[str]:
+        pack_files: List[str] = []
         for root, _, files in os.walk(self.packs_dir):
             for file in files:
                 if file.endswith(".yaml") or file.endswith(".yml"):
-                    self._load_pack(os.path.join(root, file))
-        self._validate_graph()
-        return self.nodes, self.edges, self.rules
+                    pack_files.append(os.path.join(root, file))
+        return pack_files
+
+    def _signature(self, pack_files: List[str]) -> str:
+        # Keyed by every pack file's path, mtime and size, so any edit changes it, and by the
+        # loader/model code that parsed them.
+        signature = [_code_fingerprint(), os.path.abspath(self.packs_dir)]
+        for pack_path in sorted(pack_files):
+            stat = os.stat(pack_path)
+            signature.append((os.path.abspath(pack_path), stat.st_mtime_ns, stat.st_size))
+        return hashlib.blake2b(repr(signature).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load_cache(self, cache_path: str, signature: str) -> bool:
+        # The file starts with a plain-text signature line; the pickle after it is only
+        # read when that matches the current packs and the file is ours and private.
+        try:
+            with open(cache_path, "rb") as f:
+                if not self._is_private_file(f.fileno()):
+                    return False
+                if f.readline().rstrip(b"\n") != signature.encode("ascii"):
+                    return False
+                self.nodes, self.edges, self.rules, self.syndromes, self.alias_map = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception:
+            # A stale or truncated cache is never fatal; fall back to parsing YAML.
+            self.nodes, self.edges, self.rules, self.syndromes, self.alias_map = {}, [], [], [], {}
+            return False
+        return True
+
+    @staticmethod
+    def _is_private_file(fd: int) -> bool:
+        if not hasattr(os, "getuid"):
+            return True
+        stat = os.fstat(fd)
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    def _write_cache(self, cache_path: str, signature: str) -> None:
+        payload = (self.nodes, self.edges, self.rules, self.syndromes, self.alias_map)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(signature.encode("ascii") + b"\n")
+                pickle.dump(payload, f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     def _load_pack(self, pack_path: str):
         with open(pack_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
             if not data:
                 return
 
@@ -39,6 +161,8 @@ class GraphLoader:
                     node_data['subdomain'] = self._infer_subdomain(node_data)
                 if 'time_constant' not in node_data:
                     node_data['time_constant'] = self._infer_time_constant(node_data)
+                # Node ids are dict keys everywhere downstream; share one string object per id.
+                self._intern_fields(node_data, ('id',))
                 node = Node(**node_data)
                 if node.id in self.nodes:
                     raise ValueError(f"Duplicate node ID: {node.id}")
@@ -48,6 +172,7 @@ class GraphLoader:
 
             # Load edges
             for edge_data in data.get('edges', []):
+                self._intern_fields(edge_data, ('source', 'target'))
                 edge = self._normalize_edge(Edge(**edge_data))
                 self.edges.append(edge)
 
@@ -58,9 +183,16 @@ class GraphLoader:
 
             # Load syndromes
             for syndrome_data in data.get('syndromes', []):
+                if isinstance(syndrome_data.get('sequence'), list):
+                    syndrome_data['sequence'] = [_intern(node_id) for node_id in syndrome_data['sequence']]
                 syndrome = Syndrome(**syndrome_data)
                 self.syndromes.append(syndrome)
 
+    def _intern_fields(self, data: Dict, keys) -> None:
+        for key in keys:
+            if key in data:
+                data[key] = _intern(data[key])
+
     def _validate_graph(self):
         # Ensure all edge sources and targets exist
         for edge in self.edges:
@@ -1,6 +1,8 @@
+import sys
+from dataclasses import dataclass, field
 from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 Domain = Literal["cardio", "pulm", "renal", "acidbase", "neuro"]
 Relation = Literal[
@@ -21,7 +23,12 @@ ActivationDirection = Literal["up", "down", "any"]
 Direction = Literal["up", "down", "unknown", "unchanged"]
 Magnitude = Literal["none", "small", "medium", "large"]
 
+# Engine-internal records skip validation and use slots where the interpreter supports them (3.10+).
+_SLOTTED_VALUE = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
 class Node(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     domain: Domain
@@ -41,6 +48,8 @@ class Node(BaseModel):
     value: Optional[float] = None
 
 class EdgePhase(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     at: Timescale
     rel: Optional[Relation] = None
     weight: Optional[float] = Field(default=None, ge=0.0, le=1.0)
@@ -50,6 +59,8 @@ class EdgePhase(BaseModel):
     description: Optional[str] = None
 
 class Edge(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     source: str
     target: str
     rel: Relation
@@ -86,17 +97,20 @@ class Edge(BaseModel):
                 )
         return self
 
-class CompiledEdge(BaseModel):
+@dataclass(**_SLOTTED_VALUE)
+class CompiledEdge:
+    """One temporal phase of an Edge, resolved by the engine from already-validated models."""
+
     source: str
     target: str
     at: Timescale
     at_tick: int
     rel: Relation
-    weight: float = Field(default=1.0, ge=0.0, le=1.0)
+    weight: float = 1.0
     priority: Priority = "medium"
     activation_direction: ActivationDirection = "any"
-    activation_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0)
-    context: Dict[str, bool] = Field(default_factory=dict)
+    activation_threshold: Optional[float] = None
+    context: Dict[str, bool] = field(default_factory=dict)
     description: Optional[str] = None
     is_legacy_timing: bool = False
 
@@ -117,7 +131,15 @@ class Syndrome(BaseModel):
     label: str
     sequence: List[str] = Field(default_factory=list)
 
+class GraphResponse(BaseModel):
+    nodes: List[Node] = Field(default_factory=list)
+    edges: List[Edge] = Field(default_factory=list)
+    rules: List[Rule] = Field(default_factory=list)
+    syndromes: List[Syndrome] = Field(default_factory=list)
+
 class Perturbation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     node_id: str
     op: Literal["increase", "decrease", "block", "set"]
     value: Optional[float] = None
@@ -128,6 +150,9 @@ class SimulationOptions(BaseModel):
     min_effect_size: float = 0.05
     time_window: Literal["immediate", "minutes", "hours", "days", "all"] = "all"
     dim_unaffected: bool = True
+    # Stop after the first tick by which every listed node has resolved; only those
+    # nodes' earliest states are then guaranteed to match an unbounded run.
+    target_nodes: Optional[List[str]] = None
 
 class SimulationRequest(BaseModel):
     perturbations: List[Perturbation] = Field(default_factory=list)
@@ -141,6 +166,8 @@ class TraceStep(BaseModel):
     summary: Optional[str] = None
 
 class AffectedNode(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     node_id: str
     direction: Direction
     magnitude: Magnitude = "none"
@@ -154,6 +181,12 @@ class SimulationResponse(BaseModel):
     traces: Dict[str, List[TraceStep]] = Field(default_factory=dict)
     timelines: Dict[str, List[AffectedNode]] = Field(default_factory=dict)
     max_ticks: int = 1
+    # Tick-level states for this run; kept out of the serialized payload.
+    _node_states: Dict[str, Dict[int, AffectedNode]] = PrivateAttr(default_factory=dict)
+
+    @property
+    def node_states(self) -> Dict[str, Dict[int, AffectedNode]]:
+        return self._node_states
 
 
 class ComparedNode(BaseModel):
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Parse the knowledge packs once and write the loader's pack cache.
+
+The cache is a development opt-in: processes only read it with HFP_PACK_CACHE=1.
+Run this after editing packs so the next such run skips YAML parsing.
+"""
+import argparse
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+
+sys.path.append(BACKEND_DIR)
+
+from app.graph_loader import PACK_CACHE_ENV, GraphLoader
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prebuild the parsed knowledge pack cache.")
+    parser.add_argument(
+        "--packs-dir",
+        default=os.path.join(BACKEND_DIR, "app", "knowledge", "packs"),
+        help="Directory containing knowledge packs.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Discard an existing cache for the current packs and rebuild it.",
+    )
+    args = parser.parse_args()
+
+    # This script exists to write the cache, so it always opts in.
+    os.environ[PACK_CACHE_ENV] = "1"
+    loader = GraphLoader(args.packs_dir)
+    cache_path = loader.cache_path()
+    if args.force and os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    start = time.perf_counter()
+    nodes, edges, rules = loader.load_all()
+    elapsed = time.perf_counter() - start
+
+    if not os.path.exists(cache_path):
+        print(f"Could not write pack cache at {cache_path}", file=sys.stderr)
+        return 1
+    print(
+        f"Pack cache ready: {cache_path} "
+        f"({len(nodes)} nodes, {len(edges)} edges, {len(rules)} rules, "
+        f"{len(loader.syndromes)} syndromes; loaded in {elapsed * 1000:.0f} ms)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
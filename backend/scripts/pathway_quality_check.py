@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
 import os
 import random
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple, get_args
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, get_args
 
 import yaml
 
@@ -16,16 +19,26 @@ BACKEND_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
 
 sys.path.append(BACKEND_DIR)
 
-from app.context_baselines import apply_context_baselines
-from app.engine import ReasoningEngine
-from app.graph_loader import GraphLoader
-from app.models import Edge, Perturbation, SimulationOptions, SimulationRequest
+# Backend modules are imported inside the functions that use them so that
+# --help and argument errors exit without loading the engine stack.
+if TYPE_CHECKING:
+    from app.engine import ReasoningEngine
+    from app.models import Perturbation
 
 
 Direction = str
 
+UP: Direction = sys.intern("up")
+DOWN: Direction = sys.intern("down")
+UNKNOWN: Direction = sys.intern("unknown")
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; fall back to regular instances on 3.9.
+_SPEC_DATACLASS_OPTIONS: Dict[str, bool] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _SPEC_DATACLASS_OPTIONS["slots"] = True
+
+
+@dataclass(**_SPEC_DATACLASS_OPTIONS)
 class AssertionSpec:
     target: str
     expected: Direction  # up | down | absent
@@ -34,7 +47,7 @@ class AssertionSpec:
     at_tick: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SPEC_DATACLASS_OPTIONS)
 class ScenarioSpec:
     id: str
     label: str
@@ -44,7 +57,7 @@ class ScenarioSpec:
     assertions: List[AssertionSpec]
 
 
-@dataclass
+@dataclass(**_SPEC_DATACLASS_OPTIONS)
 class HardInvariantSpec:
     id: str
     label: str
@@ -54,14 +67,14 @@ class HardInvariantSpec:
     must_hold: List[AssertionSpec]
 
 
-@dataclass
+@dataclass(**_SPEC_DATACLASS_OPTIONS)
 class RandomProbe:
     path: List[str]
     decreases_count: int
     op: str
 
 
-@dataclass
+@dataclass(**_SPEC_DATACLASS_OPTIONS)
 class GraphLintIssue:
     kind: str
     detail: str
@@ -97,6 +110,8 @@ def _phase_rel(phase: Dict[str, Any], edge: Dict[str, Any]) -> str:
 
 
 def _load_specs(path: str) -> List[ScenarioSpec]:
+    from app.models import Perturbation
+
     with open(path, "r", encoding="utf-8") as f:
         raw = yaml.safe_load(f) or {}
 
@@ -129,6 +144,8 @@ def _load_specs(path: str) -> List[ScenarioSpec]:
 
 
 def _load_hard_invariants(path: str) -> List[HardInvariantSpec]:
+    from app.models import Perturbation
+
     with open(path, "r", encoding="utf-8") as f:
         raw = yaml.safe_load(f) or {}
 
@@ -215,6 +232,10 @@ def _is_high_risk_feedback_pair(a: str, b: str) -> bool:
 
 
 def _lint_graph_structure(packs_dir: str) -> List[GraphLintIssue]:
+    from app.engine import ReasoningEngine
+    from app.graph_loader import GraphLoader
+    from app.models import Edge
+
     issues: List[GraphLintIssue] = []
     docs = _load_raw_packs(packs_dir)
     allowed_relations = set(get_args(Edge.model_fields["rel"].annotation))
@@ -377,30 +398,65 @@ def _lint_graph_structure(packs_dir: str) -> List[GraphLintIssue]:
     return issues
 
 
+PerturbationKey = Tuple[Tuple[str, str, Optional[float]], ...]
+ContextKey = Tuple[Tuple[str, bool], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _baseline_key(perturbations: PerturbationKey, context: ContextKey) -> PerturbationKey:
+    from app.context_baselines import apply_context_baselines
+    from app.models import Perturbation
+
+    merged = apply_context_baselines(
+        [Perturbation(node_id=node_id, op=op, value=value) for node_id, op, value in perturbations],
+        dict(context),
+    )
+    return tuple((p.node_id, p.op, p.value) for p in merged)
+
+
+@functools.lru_cache(maxsize=None)
+def _scenario_request(perturbations: PerturbationKey, context: ContextKey, max_hops: int) -> Any:
+    # Scenarios and invariants frequently share inputs; build each request once.
+    from app.models import Perturbation, SimulationOptions, SimulationRequest
+
+    return SimulationRequest(
+        perturbations=[
+            Perturbation(node_id=node_id, op=op, value=value)
+            for node_id, op, value in _baseline_key(perturbations, context)
+        ],
+        context=dict(context),
+        options=SimulationOptions(max_hops=max_hops),
+    )
+
+
 def _run_scenario(
     engine: ReasoningEngine,
     scenario: ScenarioSpec,
     error_prefix: str = "scenario",
 ) -> List[str]:
     errs: List[str] = []
-    perturbations = apply_context_baselines(scenario.perturbations, scenario.context)
-    req = SimulationRequest(
-        perturbations=perturbations,
-        context=scenario.context,
-        options=SimulationOptions(max_hops=scenario.max_hops),
+    req = _scenario_request(
+        tuple((p.node_id, p.op, p.value) for p in scenario.perturbations),
+        tuple(sorted(scenario.context.items())),
+        scenario.max_hops,
     )
     res = engine.simulate(req)
     affected = {a.node_id: a for a in res.affected_nodes}
     tick_states = getattr(engine, "latest_node_states", {})
+    # target -> (traces sorted longest-first, negated path lengths for bisect)
+    traces_by_length: Dict[str, Tuple[List[Any], List[int]]] = {}
 
     for assertion in scenario.assertions:
         node = affected.get(assertion.target)
         if assertion.at_tick is not None:
             node = tick_states.get(assertion.target, {}).get(assertion.at_tick)
-        traces = res.traces.get(assertion.target, [])
-        long_enough_traces = [t for t in traces if len(t.path) >= assertion.min_path_len]
+        if assertion.target not in traces_by_length:
+            sorted_traces = sorted(res.traces.get(assertion.target, []), key=lambda t: -len(t.path))
+            traces_by_length[assertion.target] = (sorted_traces, [-len(t.path) for t in sorted_traces])
+        sorted_traces, neg_lengths = traces_by_length[assertion.target]
+        long_enough_traces = sorted_traces[: bisect.bisect_right(neg_lengths, -assertion.min_path_len)]
         summarized_traces = [t for t in long_enough_traces if t.summary]
-        trace_dirs = [_trace_terminal_direction(t.steps[-1]) for t in long_enough_traces if t.steps]
+        trace_dirs = {_trace_terminal_direction(t.steps[-1]) for t in long_enough_traces if t.steps}
         trace_has_expected = assertion.expected in trace_dirs
 
         if assertion.expected == "absent":
@@ -451,19 +507,86 @@ def _run_hard_invariant(engine: ReasoningEngine, invariant: HardInvariantSpec) -
     return _run_scenario(engine, scenario_like, error_prefix="invariant")
 
 
+_WORKER_ENGINE: Optional[ReasoningEngine] = None
+# Worker pool reused across --loop-until-failure iterations while the packs are unchanged.
+_CHECK_POOL: Optional[ProcessPoolExecutor] = None
+_CHECK_POOL_SIGNATURE: Optional[str] = None
+
+
+def _init_worker(nodes: Dict[str, Any], edges: List[Any], syndromes: List[Any]) -> None:
+    # Workers receive the already parsed graph once and build their engine from it.
+    from app.engine import ReasoningEngine
+
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = ReasoningEngine(nodes, edges, syndromes)
+
+
+def _check_pool(workers: int, loader: Any, nodes: Dict[str, Any], edges: List[Any]) -> ProcessPoolExecutor:
+    global _CHECK_POOL, _CHECK_POOL_SIGNATURE
+    if _CHECK_POOL is not None and _CHECK_POOL_SIGNATURE == loader.signature:
+        return _CHECK_POOL
+    _shutdown_check_pool()
+    _CHECK_POOL = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(nodes, edges, loader.syndromes),
+    )
+    _CHECK_POOL_SIGNATURE = loader.signature
+    return _CHECK_POOL
+
+
+def _shutdown_check_pool() -> None:
+    global _CHECK_POOL, _CHECK_POOL_SIGNATURE
+    if _CHECK_POOL is not None:
+        _CHECK_POOL.shutdown()
+    _CHECK_POOL = None
+    _CHECK_POOL_SIGNATURE = None
+
+
+def _run_scenario_task(scenario: ScenarioSpec) -> List[str]:
+    return _run_scenario(_WORKER_ENGINE, scenario, error_prefix="scenario")
+
+
+def _run_hard_invariant_task(invariant: HardInvariantSpec) -> List[str]:
+    return _run_hard_invariant(_WORKER_ENGINE, invariant)
+
+
+def _run_checks_parallel(
+    pool: ProcessPoolExecutor,
+    scenarios: List[ScenarioSpec],
+    invariants: List[HardInvariantSpec],
+) -> List[str]:
+    results: List[List[str]] = [[] for _ in range(len(scenarios) + len(invariants))]
+    futures = {
+        pool.submit(_run_scenario_task, scenario): index
+        for index, scenario in enumerate(scenarios)
+    }
+    futures.update(
+        {
+            pool.submit(_run_hard_invariant_task, invariant): len(scenarios) + index
+            for index, invariant in enumerate(invariants)
+        }
+    )
+    for future in as_completed(futures):
+        results[futures[future]] = future.result()
+
+    # Keep failure ordering identical to the serial run.
+    return [failure for errs in results for failure in errs]
+
+
 def _trace_terminal_direction(last_step: str) -> Direction:
     if "→ Increased " in last_step:
-        return "up"
+        return UP
     if "→ Decreased " in last_step:
-        return "down"
-    return "unknown"
+        return DOWN
+    return UNKNOWN
 
 
 def _invert_direction(direction: Direction) -> Direction:
-    if direction == "up":
-        return "down"
-    if direction == "down":
-        return "up"
+    if direction == UP:
+        return DOWN
+    if direction == DOWN:
+        return UP
     return direction
 
 
@@ -479,35 +602,89 @@ def _is_subsequence(path: List[str], sequence: List[str]) -> bool:
     return False
 
 
+@dataclass(**_SPEC_DATACLASS_OPTIONS)
+class ProbeGraph:
+    """Integer-id CSR view of the engine's phase edges used for random walks."""
+
+    node_ids: List[str]
+    indptr: List[int]
+    targets: List[int]
+    decreases: List[bool]
+    start_ids: List[int]
+
+
+def _build_probe_graph(engine: ReasoningEngine) -> ProbeGraph:
+    node_index: Dict[str, int] = {}
+    node_ids: List[str] = []
+
+    def _intern(node_id: str) -> int:
+        if node_id not in node_index:
+            node_index[node_id] = len(node_ids)
+            node_ids.append(node_id)
+        return node_index[node_id]
+
+    # Keep engine.adj ordering so a given seed samples the same walks.
+    start_ids = [_intern(node_id) for node_id, outs in engine.adj.items() if outs]
+    for outs in engine.adj.values():
+        for edge in outs:
+            _intern(edge.target)
+
+    indptr = [0]
+    targets: List[int] = []
+    decreases: List[bool] = []
+    for node_id in node_ids:
+        for edge in engine.adj.get(node_id, []):
+            targets.append(node_index[edge.target])
+            decreases.append(edge.rel == "decreases")
+        indptr.append(len(targets))
+
+    return ProbeGraph(
+        node_ids=node_ids,
+        indptr=indptr,
+        targets=targets,
+        decreases=decreases,
+        start_ids=start_ids,
+    )
+
+
 def _sample_random_probe(
-    engine: ReasoningEngine, rng: random.Random, min_len: int, max_len: int
+    graph: ProbeGraph, rng: random.Random, min_len: int, max_len: int
 ) -> Optional[RandomProbe]:
-    candidates = [node_id for node_id, outs in engine.adj.items() if outs]
+    candidates = graph.start_ids
     if not candidates:
         return None
 
+    indptr = graph.indptr
+    targets = graph.targets
+    # Byte-per-node visited flags, allocated once and cleared along the previous walk.
+    visited = bytearray(len(graph.node_ids))
+    path: List[int] = []
     for _ in range(40):
+        for node in path:
+            visited[node] = 0
         start = rng.choice(candidates)
         desired_len = rng.randint(min_len, max_len)
         path = [start]
-        visited = {start}
+        visited[start] = 1
         decreases_count = 0
         curr = start
 
         for _ in range(desired_len - 1):
-            outgoing = [edge for edge in engine.adj.get(curr, []) if edge.target not in visited]
+            outgoing = [
+                k for k in range(indptr[curr], indptr[curr + 1]) if not visited[targets[k]]
+            ]
             if not outgoing:
                 break
-            edge = rng.choice(outgoing)
-            path.append(edge.target)
-            visited.add(edge.target)
-            curr = edge.target
-            if edge.rel == "decreases":
+            k = rng.choice(outgoing)
+            curr = targets[k]
+            path.append(curr)
+            visited[curr] = 1
+            if graph.decreases[k]:
                 decreases_count += 1
 
         if len(path) >= min_len:
             return RandomProbe(
-                path=path,
+                path=[graph.node_ids[node] for node in path],
                 decreases_count=decreases_count,
                 op=rng.choice(["increase", "decrease"]),
             )
@@ -515,6 +692,19 @@ def _sample_random_probe(
     return None
 
 
+def _index_traces(
+    res: Any,
+) -> Tuple[Dict[Tuple[str, str, str], List[Any]], Dict[Tuple[str, Tuple[str, ...]], List[Any]]]:
+    by_endpoints: Dict[Tuple[str, str, str], List[Any]] = {}
+    by_path: Dict[Tuple[str, Tuple[str, ...]], List[Any]] = {}
+    for target, traces in res.traces.items():
+        for trace in traces:
+            by_path.setdefault((target, tuple(trace.path)), []).append(trace)
+            if trace.path:
+                by_endpoints.setdefault((target, trace.path[0], trace.path[-1]), []).append(trace)
+    return by_endpoints, by_path
+
+
 def _run_random_probes(
     engine: ReasoningEngine,
     probe_count: int,
@@ -524,6 +714,8 @@ def _run_random_probes(
     seed: Optional[int],
     strict_random_probes: bool,
 ) -> Tuple[List[str], int, List[str], List[str]]:
+    from app.models import Perturbation, SimulationOptions, SimulationRequest
+
     if probe_count <= 0:
         return [], 0, [], []
 
@@ -532,36 +724,42 @@ def _run_random_probes(
     warnings: List[str] = []
     evaluated = 0
     sampled_paths: List[str] = []
-    sim_cache = {}
 
+    # Phase 1: sample every probe up front so simulation runs once per distinct start/op.
+    probe_graph = _build_probe_graph(engine)
+    probes: List[RandomProbe] = []
     for _ in range(probe_count):
-        probe = _sample_random_probe(engine, rng, min_len=min_len, max_len=max_len)
-        if not probe:
+        probe = _sample_random_probe(probe_graph, rng, min_len=min_len, max_len=max_len)
+        if probe:
+            probes.append(probe)
+
+    # Phase 2: simulate each unique (start, op) perturbation and index its traces.
+    sim_cache = {}
+    for probe in probes:
+        cache_key = (probe.path[0], probe.op)
+        if cache_key in sim_cache:
             continue
+        req = SimulationRequest(
+            perturbations=[Perturbation(node_id=probe.path[0], op=probe.op)],
+            context={},
+            options=SimulationOptions(max_hops=max_hops),
+        )
+        sim_cache[cache_key] = _index_traces(engine.simulate(req))
 
+    # Phase 3: evaluate each probe against its cached simulation.
+    for probe in probes:
         start = probe.path[0]
         target = probe.path[-1]
-        expected_if_increase = "down" if probe.decreases_count % 2 else "up"
+        expected_if_increase = DOWN if probe.decreases_count % 2 else UP
         expected = expected_if_increase if probe.op == "increase" else _invert_direction(expected_if_increase)
         sampled_paths.append(
             f"{probe.op} {start} | {' -> '.join(probe.path)} | expect {target}={expected}"
         )
-        cache_key = (start, probe.op, max_hops)
-
-        if cache_key not in sim_cache:
-            req = SimulationRequest(
-                perturbations=[Perturbation(node_id=start, op=probe.op)],
-                context={},
-                options=SimulationOptions(max_hops=max_hops),
-            )
-            sim_cache[cache_key] = engine.simulate(req)
+        cache_key = (start, probe.op)
 
-        res = sim_cache[cache_key]
-        traces = res.traces.get(target, [])
-        matching_traces = [t for t in traces if t.path == probe.path]
-        soft_matching_traces = [
-            t for t in traces if t.path and t.path[0] == start and t.path[-1] == target
-        ]
+        traces_by_endpoints, traces_by_path = sim_cache[cache_key]
+        matching_traces = traces_by_path.get((target, tuple(probe.path)), [])
+        soft_matching_traces = traces_by_endpoints.get((target, start, target), [])
         evaluated += 1
 
         if not matching_traces:
@@ -582,9 +780,9 @@ def _run_random_probes(
             )
             continue
 
-        trace_dirs = [
+        trace_dirs = {
             _trace_terminal_direction(t.steps[-1]) for t in matching_traces if t.steps
-        ]
+        }
         if expected not in trace_dirs:
             failures.append(
                 f"[random_probe] direction mismatch for {' -> '.join(probe.path)} (expected {expected})"
@@ -594,6 +792,9 @@ def _run_random_probes(
 
 
 def _execute_single_run(args) -> int:
+    from app.engine import ReasoningEngine
+    from app.graph_loader import GraphLoader
+
     lint_issues = _lint_graph_structure(args.packs_dir)
     loader = GraphLoader(args.packs_dir)
     try:
@@ -619,10 +820,14 @@ def _execute_single_run(args) -> int:
 
     failures: List[str] = []
     failures.extend([f"[lint:{issue.kind}] {issue.detail}" for issue in lint_issues])
-    for scenario in scenarios:
-        failures.extend(_run_scenario(engine, scenario, error_prefix="scenario"))
-    for invariant in invariants:
-        failures.extend(_run_hard_invariant(engine, invariant))
+    if args.workers > 1:
+        pool = _check_pool(args.workers, loader, nodes, edges)
+        failures.extend(_run_checks_parallel(pool, scenarios, invariants))
+    else:
+        for scenario in scenarios:
+            failures.extend(_run_scenario(engine, scenario, error_prefix="scenario"))
+        for invariant in invariants:
+            failures.extend(_run_hard_invariant(engine, invariant))
     random_failures, random_evaluated, sampled_paths, random_warnings = _run_random_probes(
         engine=engine,
         probe_count=args.random_probes,
@@ -733,6 +938,15 @@ def main() -> int:
         action="store_true",
         help="Treat random probe path-realization misses as hard failures (default: warnings).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for scenario and invariant checks (default 1 runs them serially; "
+            "more only pays off for large scenario sets)."
+        ),
+    )
     parser.add_argument(
         "--loop-until-failure",
         action="store_true",
@@ -752,6 +966,13 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    try:
+        return _run(args)
+    finally:
+        _shutdown_check_pool()
+
+
+def _run(args) -> int:
     if not args.loop_until_failure:
         return _execute_single_run(args)
 
@@ -5,7 +5,7 @@ import argparse
 import json
 import os
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
 BACKEND_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
@@ -16,6 +16,14 @@ from app.engine import ReasoningEngine
 from app.graph_loader import GraphLoader
 
 
+REACHABILITY_SECTIONS = (
+    ("direct_downstream", "Direct Downstream"),
+    ("direct_upstream", "Direct Upstream"),
+    ("multi_hop_downstream", "Multi-hop Downstream"),
+    ("multi_hop_upstream", "Multi-hop Upstream"),
+)
+
+
 def _load_engine() -> ReasoningEngine:
     packs_dir = os.path.join(BACKEND_DIR, "app", "knowledge", "packs")
     loader = GraphLoader(packs_dir)
@@ -24,40 +32,38 @@ def _load_engine() -> ReasoningEngine:
 
 
 def _filter_reachability(
-    reachability: Dict[str, Dict[str, List[str]]],
+    reachability: Mapping[str, Dict[str, List[str]]],
     node_filter: List[str],
 ) -> Dict[str, Dict[str, List[str]]]:
     if not node_filter:
-        return reachability
-    selected = set(node_filter)
+        return dict(reachability)
+    # Look up only the selected ids so lazily decoded sections stay lazy.
     return {
-        node_id: timescales
-        for node_id, timescales in reachability.items()
-        if node_id in selected
+        node_id: reachability[node_id]
+        for node_id in dict.fromkeys(node_filter)
+        if node_id in reachability
     }
 
 
 def _render_reachability_section(
     title: str,
     reachability: Dict[str, Dict[str, List[str]]],
+    ordered_keys: List[str],
 ) -> List[str]:
     lines = [f"## {title}"]
     if not reachability:
         lines.append("_No nodes selected._")
         return lines
 
-    for node_id in sorted(reachability.keys()):
+    for node_id in ordered_keys:
         lines.append(f"### {node_id}")
-        timescale_map = reachability[node_id]
-        any_values = False
-        for timescale in ("immediate", "minutes", "hours", "days"):
-            values = timescale_map.get(timescale, [])
-            if not values:
-                continue
-            any_values = True
-            lines.append(f"- {timescale}: {', '.join(values)}")
-        if not any_values:
-            lines.append("- none")
+        # Timescale buckets are built in immediate -> days order by the dependency index.
+        entries = [
+            f"- {timescale}: {', '.join(values)}"
+            for timescale, values in reachability[node_id].items()
+            if values
+        ]
+        lines.extend(entries or ["- none"])
     return lines
 
 
@@ -114,14 +120,13 @@ def _render_markdown(report: Dict[str, Any], engine: ReasoningEngine) -> str:
     else:
         lines.append("_No feedback clusters found._")
 
-    lines.extend([""])
-    lines.extend(_render_reachability_section("Direct Downstream", report["direct_downstream"]))
-    lines.extend([""])
-    lines.extend(_render_reachability_section("Direct Upstream", report["direct_upstream"]))
-    lines.extend([""])
-    lines.extend(_render_reachability_section("Multi-hop Downstream", report["multi_hop_downstream"]))
-    lines.extend([""])
-    lines.extend(_render_reachability_section("Multi-hop Upstream", report["multi_hop_upstream"]))
+    section_key_order = {
+        key: sorted(report[key].keys())
+        for key, _ in REACHABILITY_SECTIONS
+    }
+    for key, title in REACHABILITY_SECTIONS:
+        lines.append("")
+        lines.extend(_render_reachability_section(title, report[key], section_key_order[key]))
 
     return "\n".join(lines).rstrip() + "\n"
 
@@ -150,7 +155,7 @@ def main() -> int:
 
     engine = _load_engine()
     report = engine.build_dependency_index(max_tick=args.max_tick)
-    for key in ("direct_downstream", "direct_upstream", "multi_hop_downstream", "multi_hop_upstream"):
+    for key, _ in REACHABILITY_SECTIONS:
         report[key] = _filter_reachability(report[key], args.node)
 
     if args.format == "json":
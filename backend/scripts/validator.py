@@ -1,39 +1,56 @@
 import yaml
 import os
+import sys
+from operator import itemgetter
 from pathlib import Path
 
+# Prefer the libyaml-backed parser when PyYAML was built with it.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _iter_pack_files(pack_dir):
+    # Same traversal order as os.walk: files in a directory first, then its subdirectories.
+    subdirs = []
+    with os.scandir(pack_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".yaml"):
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from _iter_pack_files(subdir)
+
+
+def _format_row(edge):
+    source = edge.get('source', '')
+    rel = edge.get('rel', '')
+    target = edge.get('target', '')
+    weight = edge.get('weight', 1.0)
+    pri = edge.get('priority', 'medium')
+    ctx = str(edge.get('context', {}))
+    desc = edge.get('description', '').replace('\n', ' ')
+    return f"| {source} | {rel} | {target} | {weight} | {pri} | {ctx} | {desc} |"
+
+
 def validate():
     pack_dir = Path("app/knowledge/packs")
-    all_edges = []
-    
+    rows = []
+
     # Load all yaml files
-    for root, dirs, files in os.walk(pack_dir):
-        for file in files:
-            if file.endswith(".yaml"):
-                path = Path(root) / file
-                with open(path, 'r') as f:
-                    data = yaml.safe_load(f)
-                    if 'edges' in data:
-                        for edge in data['edges']:
-                            # Add source pack for context
-                            edge['pack'] = data.get('name', file)
-                            all_edges.append(edge)
+    for path in _iter_pack_files(pack_dir):
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=YamlLoader)
+        for edge in data.get('edges', []):
+            rows.append({'source': edge.get('source', ''), 'line': _format_row(edge)})
 
     # Generate Markdown Table
-    print("# Physiological Truth Table (Extracted Links)\n")
-    print("| Source | Relation | Target | Weight | Priority | Context | Description |")
-    print("| :--- | :--- | :--- | :--- | :--- | :--- | :--- |")
-    
-    for edge in sorted(all_edges, key=lambda x: x['source']):
-        source = edge.get('source', '')
-        rel = edge.get('rel', '')
-        target = edge.get('target', '')
-        weight = edge.get('weight', 1.0)
-        pri = edge.get('priority', 'medium')
-        ctx = str(edge.get('context', {}))
-        desc = edge.get('description', '').replace('\n', ' ')
-        
-        print(f"| {source} | {rel} | {target} | {weight} | {pri} | {ctx} | {desc} |")
+    lines = [
+        "# Physiological Truth Table (Extracted Links)\n",
+        "| Source | Relation | Target | Weight | Priority | Context | Description |",
+        "| :--- | :--- | :--- | :--- | :--- | :--- | :--- |",
+    ]
+    lines.extend(row['line'] for row in sorted(rows, key=itemgetter('source')))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     validate()
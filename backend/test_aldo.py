@@ -1,22 +1,15 @@
-from app.api import engine
-from app.models import SimulationRequest, Perturbation, SimulationOptions
+from _test_aldo_common import run_svr_increase
 
-req = SimulationRequest(
-    perturbations=[Perturbation(node_id='cardio.hemodynamics.svr', op='increase')],
-    context={},
-    options=SimulationOptions(max_hops=15, min_confidence=0.0, time_window='days', dim_unaffected=False),
-    expanded_nodes=[], resolution='micro', show_readouts=False
-)
-res = engine.simulate(req)
+res, latest_node_states = run_svr_increase()
 
 print('=== Aldo ===')
-if 'renal.raas.aldosterone' in engine.latest_node_states:
-    print(list(engine.latest_node_states['renal.raas.aldosterone'].items()))
+if 'renal.raas.aldosterone' in latest_node_states:
+    print(list(latest_node_states['renal.raas.aldosterone'].items()))
 
 print('=== MR ===')
-if 'renal.raas.mr_receptor' in engine.latest_node_states:
-    print(list(engine.latest_node_states['renal.raas.mr_receptor'].items()))
+if 'renal.raas.mr_receptor' in latest_node_states:
+    print(list(latest_node_states['renal.raas.mr_receptor'].items()))
 
 print('=== H+ ===')
-if 'acidbase.blood.h_concentration' in engine.latest_node_states:
-    print(list(engine.latest_node_states['acidbase.blood.h_concentration'].items()))
+if 'acidbase.blood.h_concentration' in latest_node_states:
+    print(list(latest_node_states['acidbase.blood.h_concentration'].items()))
@@ -0,0 +1,43 @@
+import functools
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.engine import ReasoningEngine
+from app.graph_loader import GraphLoader
+
+PACKS_DIR = os.path.join(os.path.dirname(__file__), "..", "app", "knowledge", "packs")
+
+
+def pytest_configure(config):
+    # Tests always parse the YAML packs, even when a developer shell has opted into the
+    # cache; the cache test opts back in with its own directory. Set before collection,
+    # since importing app.api already loads the graph.
+    os.environ["HFP_PACK_CACHE"] = "0"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_packs(packs_dir: str):
+    # Parsed once per process; the models are frozen and the collections are tuples,
+    # so callers cannot mutate what later callers receive.
+    loader = GraphLoader(packs_dir)
+    nodes, edges, rules = loader.load_all()
+    return tuple(nodes.items()), tuple(edges), tuple(rules), tuple(loader.syndromes)
+
+
+@pytest.fixture(scope="session")
+def engine() -> ReasoningEngine:
+    # One engine over the shipped packs serves every test. It memoizes SimulationResponse
+    # objects across requests, so a cached response may be handed to several tests:
+    # treat responses (and their node_states) as read-only.
+    nodes, edges, _, syndromes = _load_packs(PACKS_DIR)
+    return ReasoningEngine(dict(nodes), list(edges), list(syndromes))
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Importing the app loads the knowledge graph, so do it once per session.
+    from app.main import app
+
+    return TestClient(app)
@@ -1,15 +1,10 @@
 import pytest
-from fastapi.testclient import TestClient
 
 from app.api import _classify_change
-from app.main import app
 from app.models import AffectedNode
 
 
-client = TestClient(app)
-
-
-def test_compare_endpoint_returns_changed_nodes():
+def test_compare_endpoint_returns_changed_nodes(client):
     payload = {
         "baseline": {
             "perturbations": [],
@@ -42,6 +37,17 @@ def test_compare_endpoint_returns_changed_nodes():
     assert all("effect_size_delta" in item for item in body["changed_nodes"])
 
 
+def test_graph_endpoint_serializes_edges_with_temporal_profile(client):
+    response = client.get("/api/graph")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"nodes", "edges", "rules", "syndromes"}
+    assert any(node["id"] == "cardio.hemodynamics.map" for node in body["nodes"])
+    assert all(edge["temporal_profile"] for edge in body["edges"])
+    assert all("_legacy_timing" not in edge for edge in body["edges"])
+
+
 def test_classify_change_prefers_effect_size_delta():
     baseline = AffectedNode(
         node_id="node",
@@ -1,19 +1,8 @@
-import os
-
 from app.context_baselines import apply_context_baselines
-from app.engine import ReasoningEngine
-from app.graph_loader import GraphLoader
 from app.models import Perturbation, SimulationOptions, SimulationRequest
 
 
-def _engine() -> ReasoningEngine:
-    packs_dir = os.path.join(os.path.dirname(__file__), "..", "app", "knowledge", "packs")
-    loader = GraphLoader(packs_dir)
-    nodes, edges, rules = loader.load_all()
-    return ReasoningEngine(nodes, edges, loader.syndromes)
-
-
-def test_ckd_context_injects_baseline_renal_impairment():
+def test_ckd_context_injects_baseline_renal_impairment(engine):
     with_ckd = apply_context_baselines([], {"ckd": True})
     without_ckd = apply_context_baselines([], {})
     ckd_nodes = {p.node_id for p in with_ckd}
@@ -27,7 +16,7 @@ def test_ckd_context_injects_baseline_renal_impairment():
         context={"ckd": True},
         options=SimulationOptions(max_hops=4),
     )
-    res = _engine().simulate(req)
+    res = engine.simulate(req)
 
     assert len(res.affected_nodes) > 0
 
@@ -40,8 +29,7 @@ def test_user_perturbation_precedes_context_default_for_same_node():
     assert potassium_ops == ["decrease"]
 
 
-def test_ckd_context_impedes_renal_downstream_response():
-    engine = _engine()
+def test_ckd_context_impedes_renal_downstream_response(engine):
     base_perturbations = [Perturbation(node_id="renal.raas.renin", op="increase")]
 
     no_ckd_req = SimulationRequest(
@@ -64,8 +52,7 @@ def test_ckd_context_impedes_renal_downstream_response():
     assert ckd.get("renal.metabolism.potassium") == "up"
 
 
-def test_context_only_simulation_produces_syndrome_summaries():
-    engine = _engine()
+def test_context_only_simulation_produces_syndrome_summaries(engine):
     context = {"copd": True}
     req = SimulationRequest(
         perturbations=apply_context_baselines([], context),
@@ -1,3 +1,6 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from app.engine import ReasoningEngine
 from app.models import Edge, EdgePhase, Node, Perturbation, SimulationOptions, SimulationRequest
@@ -89,6 +92,18 @@ def test_temporal_phase_with_only_hours_has_no_immediate_effect():
     assert res.timelines["B"][0].timescale == "hours"
 
 
+def test_edges_to_unknown_nodes_do_not_break_engine_construction():
+    nodes = {"A": Node(id="A", label="A", domain="cardio", type="variable")}
+    edges = [Edge(source="A", target="B", rel="increases")]
+
+    engine = ReasoningEngine(nodes, edges)
+    index = engine.build_dependency_index()
+
+    assert "B" in engine.node_names
+    assert index["direct_downstream"]["A"]["immediate"] == ["B"]
+    assert index["multi_hop_downstream"]["A"]["immediate"] == ["B"]
+
+
 def test_temporal_phase_can_change_relation_by_time():
     nodes = {
         "A": Node(id="A", label="A", domain="cardio", type="variable"),
@@ -181,3 +196,99 @@ def test_summary_prefers_stronger_earlier_effect_over_weaker_feedback():
     assert affected["B"].direction == "up"
     assert affected["B"].effect_size == pytest.approx(0.6)
     assert engine.latest_node_states["B"][2].direction == "down"
+
+
+def test_simulate_batch_matches_individual_runs(engine):
+    requests = [
+        SimulationRequest(
+            perturbations=[Perturbation(node_id="A", op="increase")],
+            options=SimulationOptions(max_hops=2),
+        ),
+        SimulationRequest(
+            perturbations=[Perturbation(node_id="B", op="decrease")],
+            options=SimulationOptions(max_hops=1),
+        ),
+    ]
+
+    batched = engine.simulate_batch(requests)
+    engine.reset_cache()
+    individual = [engine.simulate(request) for request in requests]
+
+    assert [res.model_dump() for res in batched] == [res.model_dump() for res in individual]
+
+
+def test_repeated_simulation_is_served_from_cache(engine):
+    up = SimulationRequest(
+        perturbations=[Perturbation(node_id="A", op="increase")],
+        options=SimulationOptions(max_hops=2),
+    )
+    down = SimulationRequest(
+        perturbations=[Perturbation(node_id="A", op="decrease")],
+        options=SimulationOptions(max_hops=2),
+    )
+
+    first = engine.simulate(up)
+    engine.simulate(down)
+    again = engine.simulate(up)
+
+    assert again is first
+    assert engine.latest_node_states["B"][0].direction == "up"
+    assert engine.simulate(up.model_copy(update={"options": SimulationOptions(max_hops=1)})) is not first
+
+
+def test_target_nodes_stop_after_targets_resolve():
+    nodes = {
+        node_id: Node(id=node_id, label=node_id, domain="cardio", type="variable")
+        for node_id in ("A", "B", "C")
+    }
+    edges = [
+        Edge(source="A", target="B", rel="increases", temporal_profile=[EdgePhase(at="immediate")]),
+        Edge(source="B", target="C", rel="increases", temporal_profile=[EdgePhase(at="hours")]),
+    ]
+    engine = ReasoningEngine(nodes, edges)
+    full = engine.simulate(
+        SimulationRequest(perturbations=[Perturbation(node_id="A", op="increase")])
+    )
+    targeted = engine.simulate(
+        SimulationRequest(
+            perturbations=[Perturbation(node_id="A", op="increase")],
+            options=SimulationOptions(target_nodes=["B"]),
+        )
+    )
+
+    full_affected = {a.node_id: a for a in full.affected_nodes}
+    targeted_affected = {a.node_id: a for a in targeted.affected_nodes}
+    assert targeted_affected["B"] == full_affected["B"]
+    assert "C" in full_affected
+    assert "C" not in targeted_affected
+
+
+def test_concurrent_simulations_match_serial_runs(engine):
+    requests = [
+        SimulationRequest(
+            perturbations=[Perturbation(node_id=node_id, op=op)],
+            options=SimulationOptions(max_hops=hops),
+        )
+        for node_id in ("A", "B", "C")
+        for op in ("increase", "decrease")
+        for hops in (1, 2)
+    ]
+
+    serial = [engine.simulate(request) for request in requests]
+    expected_dumps = [res.model_dump() for res in serial]
+    expected_states = [res.node_states for res in serial]
+
+    # Force frequent thread switches and repeat with a cold cache, since a race between
+    # runs only shows up under some interleavings.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for _ in range(200):
+                engine.reset_cache()
+                threaded = list(pool.map(engine.simulate, requests))
+
+                assert [res.model_dump() for res in threaded] == expected_dumps
+                assert [res.node_states for res in threaded] == expected_states
+    finally:
+        sys.setswitchinterval(switch_interval)
@@ -1,6 +1,9 @@
+import os
+
 import pytest
 import yaml
 from app.engine import ReasoningEngine
+from app import graph_loader
 from app.graph_loader import GraphLoader
 
 def test_graph_loader(tmp_path):
@@ -35,6 +38,50 @@ def test_graph_loader(tmp_path):
     assert len(edges[0].temporal_profile) == 1
     assert edges[0].temporal_profile[0].at == "immediate"
 
+def test_pack_cache_round_trip_and_opt_out(tmp_path, monkeypatch):
+    packs_dir = tmp_path / "packs"
+    packs_dir.mkdir()
+    pack = packs_dir / "pack.yaml"
+    pack.write_text(yaml.dump({
+        "nodes": [
+            {"id": "node1", "label": "Node 1", "domain": "cardio", "type": "variable"},
+            {"id": "node2", "label": "Node 2", "domain": "renal", "type": "variable"},
+        ],
+        "edges": [{"source": "node1", "target": "node2", "rel": "increases"}],
+    }))
+    monkeypatch.setenv("HFP_PACK_CACHE_DIR", str(tmp_path / "cache"))
+    loader = GraphLoader(str(packs_dir))
+
+    monkeypatch.setenv("HFP_PACK_CACHE", "0")
+    loader.load_all()
+    assert not os.path.exists(loader.cache_path())
+
+    monkeypatch.setenv("HFP_PACK_CACHE", "1")
+    nodes, edges, _ = loader.load_all()
+    assert os.path.exists(loader.cache_path())
+    cached_nodes, cached_edges, _ = GraphLoader(str(packs_dir)).load_all()
+    assert cached_nodes == nodes
+    assert cached_edges == edges
+    assert cached_edges[0]._legacy_timing
+
+    # Editing a pack rewrites the same cache file instead of adding another.
+    pack.write_text(yaml.dump({
+        "nodes": [{"id": "node3", "label": "Node 3", "domain": "pulm", "type": "variable"}],
+        "edges": [],
+    }))
+    os.utime(pack, ns=(0, 0))
+    reloaded_nodes, _, _ = GraphLoader(str(packs_dir)).load_all()
+    assert list(reloaded_nodes) == ["node3"]
+    assert os.listdir(tmp_path / "cache") == [os.path.basename(loader.cache_path())]
+
+    # Loader or model code changes invalidate the cache as well, with no version bump.
+    cached_signature = loader.pack_signature()
+    monkeypatch.setattr(graph_loader, "_code_fingerprint", lambda: "edited-loader-code")
+    assert loader.pack_signature() != cached_signature
+    GraphLoader(str(packs_dir)).load_all()
+    with open(loader.cache_path(), "rb") as f:
+        assert f.readline().strip().decode() == loader.pack_signature()
+
 def test_duplicate_id(tmp_path):
     pack1 = tmp_path / "pack1.yaml"
     pack1.write_text(yaml.dump({
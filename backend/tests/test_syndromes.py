@@ -1,18 +1,6 @@
-import os
-import pytest
-from app.graph_loader import GraphLoader
-from app.engine import ReasoningEngine
 from app.models import Perturbation, SimulationRequest, SimulationOptions
 
 
-@pytest.fixture
-def engine():
-    packs_dir = os.path.join(os.path.dirname(__file__), "..", "app", "knowledge", "packs")
-    loader = GraphLoader(packs_dir)
-    nodes, edges, rules = loader.load_all()
-    return ReasoningEngine(nodes, edges, loader.syndromes)
-
-
 def test_alkalemia_syndrome_summary(engine):
     request = SimulationRequest(
         perturbations=[Perturbation(node_id="acidbase.blood.h_concentration", op="decrease")],
@@ -1,4 +1,4 @@
-from app.engine import ReasoningEngine
+from app.engine import TIME_MAP, LazyReachability, ReasoningEngine
 from app.models import Edge, EdgePhase, Node
 
 
@@ -89,3 +89,98 @@ def test_dependency_index_flags_immediate_only_feedback_loops():
     assert len(index["review_candidates"]["fast_feedback_loops"]) == 1
     assert "A increases B" in index["review_candidates"]["immediate_only_high_weight_edges"]
     assert "B decreases A" in index["review_candidates"]["immediate_only_high_weight_edges"]
+
+
+def test_dependency_index_is_memoized_per_max_tick():
+    nodes = {node_id: _node(node_id) for node_id in ("A", "B")}
+    edges = [
+        Edge(
+            source="A",
+            target="B",
+            rel="increases",
+            temporal_profile=[EdgePhase(at="hours")],
+        ),
+    ]
+    engine = ReasoningEngine(nodes, edges)
+
+    first = engine.build_dependency_index()
+    first["multi_hop_downstream"] = {}
+    second = engine.build_dependency_index()
+
+    assert second["multi_hop_downstream"]["A"]["hours"] == ["B"]
+    assert second["sccs"] is first["sccs"]
+    assert "B" not in engine.build_dependency_index(max_tick=1)["multi_hop_downstream"].get("A", {}).get("hours", [])
+
+
+def test_multi_hop_reachability_is_decoded_on_demand():
+    node_ids = ["A", "B", "C"]
+    # A reaches B immediately and C from hours on; B and C reach nothing.
+    masks = [[0b011, 0b010, 0b100], [0b011, 0b010, 0b100], [0b111, 0b010, 0b100], [0b111, 0b010, 0b100]]
+    mask_builds = []
+    decoded_masks = []
+
+    def compute_masks():
+        mask_builds.append(True)
+        return masks
+
+    def decode_mask(mask):
+        decoded_masks.append(mask)
+        return [node_id for bit, node_id in enumerate(node_ids) if mask >> bit & 1]
+
+    downstream = LazyReachability(node_ids, {"A": 0, "B": 1, "C": 2}, compute_masks, decode_mask)
+    assert mask_builds == []
+
+    assert downstream["A"] == {"immediate": ["B"], "minutes": [], "hours": ["C"], "days": []}
+    assert downstream["A"] is downstream["A"]
+    assert len(mask_builds) == 1
+    assert len(decoded_masks) == len(TIME_MAP)
+    assert "D" not in downstream
+    assert list(downstream.to_dict()) == node_ids
+    assert len(decoded_masks) == len(TIME_MAP) * len(node_ids)
+
+
+def test_lazy_multi_hop_reachability_matches_materialized_sections():
+    nodes = {node_id: _node(node_id) for node_id in ("A", "B", "C")}
+    edges = [
+        Edge(
+            source="A",
+            target="B",
+            rel="increases",
+            temporal_profile=[EdgePhase(at="immediate")],
+        ),
+        Edge(
+            source="B",
+            target="C",
+            rel="increases",
+            temporal_profile=[EdgePhase(at="hours")],
+        ),
+        Edge(
+            source="B",
+            target="A",
+            rel="decreases",
+            temporal_profile=[EdgePhase(at="hours")],
+        ),
+    ]
+    engine = ReasoningEngine(nodes, edges)
+
+    downstream = engine.build_dependency_index()["multi_hop_downstream"]
+
+    assert downstream.to_dict() == {
+        "A": {"immediate": ["B"], "minutes": [], "hours": ["C"], "days": []},
+        "B": {"immediate": [], "minutes": [], "hours": ["A", "C"], "days": []},
+        "C": {"immediate": [], "minutes": [], "hours": [], "days": []},
+    }
+
+
+def test_feedback_cluster_detection_handles_cycles_deeper_than_the_recursion_limit():
+    node_ids = [f"N{position:04d}" for position in range(3000)]
+    nodes = {node_id: _node(node_id) for node_id in node_ids}
+    edges = [
+        Edge(source=source, target=target, rel="increases", weight=0.5)
+        for source, target in zip(node_ids, node_ids[1:] + node_ids[:1])
+    ]
+    engine = ReasoningEngine(nodes, edges)
+
+    index = engine.build_dependency_index(max_tick=0)
+
+    assert index["sccs"] == [node_ids]